@@ -1,20 +1,24 @@
 """Module containing the base classes for selective inference."""
 
+import math
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import partial
+from itertools import chain, pairwise
 from typing import Any, Literal
 
 import numpy as np
-from joblib import Parallel, delayed  # type: ignore[import]
-from scipy.stats import rv_continuous  # type: ignore[import]
+from joblib import Parallel, delayed, effective_n_jobs  # type: ignore[import]
+from scipy.special import log_ndtr  # type: ignore[import]
+from scipy.stats import norm, rv_continuous  # type: ignore[import]
 from tqdm import tqdm  # type: ignore[import]
 
-from .cdf import truncated_cdf
+from .cdf import truncated_cdf, truncated_cdf_range
 from .real_subset import RealSubset
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectiveInferenceResult:
     """A class containing the results of selective inference.
 
@@ -53,17 +57,25 @@ class SelectiveInferenceResult:
     null_rv: rv_continuous
     alternative: Literal["two-sided", "less", "greater"]
 
-    def __post_init__(self) -> None:
-        """Compute the logarithm of the naive p-value and store it in the cache."""
+    def _compute_log_naive_p_value(self) -> float:
+        """Compute the logarithm of the naive p-value.
+
+        Returns
+        -------
+        float
+            The logarithm of the naive p-value.
+        """
         match self.alternative:
             case "two-sided":
-                self._log_naive_p_value = np.log(2.0) + self.null_rv.logcdf(
-                    -np.abs(self.stat),
+                log_naive_p_value = math.log(2.0) + _logcdf(
+                    self.null_rv,
+                    -abs(self.stat),
                 )
             case "less":
-                self._log_naive_p_value = self.null_rv.logsf(self.stat)
+                log_naive_p_value = _logcdf(self.null_rv, self.stat, upper=True)
             case "greater":
-                self._log_naive_p_value = self.null_rv.logcdf(self.stat)
+                log_naive_p_value = _logcdf(self.null_rv, self.stat)
+        return log_naive_p_value
 
     def naive_p_value(self) -> float:
         """Compute the naive p-value.
@@ -73,7 +85,7 @@ class SelectiveInferenceResult:
         float
             The naive p-value.
         """
-        return np.exp(self._log_naive_p_value)
+        return np.exp(self._compute_log_naive_p_value())
 
     def bonferroni_p_value(self, log_num_comparisons: float) -> float:
         """Compute the Bonferroni-corrected p-value.
@@ -88,9 +100,8 @@ class SelectiveInferenceResult:
         float
             The Bonferroni-corrected p-value.
         """
-        log_bonferroni_p_value = np.clip(
-            self._log_naive_p_value + log_num_comparisons,
-            -np.inf,
+        log_bonferroni_p_value = min(
+            self._compute_log_naive_p_value() + log_num_comparisons,
             0.0,
         )
         return np.exp(log_bonferroni_p_value)
@@ -106,13 +117,11 @@ class SelectiveInferenceResult:
         precision = 6
 
         def _convert(intervals: list[list[float]], precision: float) -> str:
-            return (
-                "["
-                + ", ".join(
-                    [f"[{l:.{precision}f}, {u:.{precision}f}]" for l, u in intervals],
-                )
-                + "]"
+            # format all the endpoints with a single template
+            template = ", ".join(
+                [f"[{{:.{precision}f}}, {{:.{precision}f}}]"] * len(intervals),
             )
+            return "[" + template.format(*chain.from_iterable(intervals)) + "]"
 
         return "\n".join(
             [
@@ -266,7 +275,8 @@ class SelectiveInference:
         SelectiveInferenceResult
             The result of the selective inference.
         """
-        self.max_iter = max_iter
+        # compare the iteration count against a plain int in the search loops
+        self.max_iter = int(max_iter)
         self.step = step
         self.significance_level = significance_level
         self.precision = precision
@@ -275,6 +285,34 @@ class SelectiveInference:
         if alternative is not None:
             self.alternative = alternative
 
+        # conversion from the cdf value to the p-value, fixed during the inference
+        self._absolute = self.alternative == "two-sided"
+        match self.alternative:
+            case "two-sided" | "less":
+                self._cdf_value_to_pvalue = _upper_tail_pvalue
+            case "greater":
+                self._cdf_value_to_pvalue = _lower_tail_pvalue
+
+        # region below the test statistic, which is fixed during the inference
+        if self._absolute:
+            self._mask_intervals = RealSubset(
+                [[-np.abs(self.stat), np.abs(self.stat)]],
+            )
+        else:
+            self._mask_intervals = RealSubset([[-np.inf, self.stat]])
+
+        # median of the null distribution, used in every evaluation of the cdf
+        self._median = self.null_rv.median()
+
+        # bounds of the last evaluation, reused when evaluated again for the same
+        # truncated and unsearched intervals in the support, which also holds for
+        # a step that searched only outside of the support
+        self._last_bounds: tuple[RealSubset, RealSubset, float, float] | None = None
+
+        # unsearched intervals of the last searched intervals, shared by
+        # the termination criterion and the search strategy in the next step
+        self._last_unsearched: tuple[RealSubset, RealSubset] | None = None
+
         if n_jobs > 1 or n_jobs == -1:
             return self._inference_parallel(
                 algorithm,
@@ -304,6 +342,9 @@ class SelectiveInference:
                 termination_criterion,
             )
 
+        # only z varies over the search, so bind the fixed search direction vectors
+        bound_algorithm = partial(algorithm, self.a, self.b)
+
         searched_intervals = RealSubset()
         truncated_intervals = RealSubset()
         search_count, detect_count = 0, 0
@@ -311,7 +352,7 @@ class SelectiveInference:
         before_searched_intervals = RealSubset()
         while True:
             z = search_strategy(searched_intervals)
-            model, intervals_ = algorithm(self.a, self.b, z)
+            model, intervals_ = bound_algorithm(z)
             intervals = (
                 intervals_
                 if isinstance(intervals_, RealSubset)
@@ -324,7 +365,7 @@ class SelectiveInference:
                 detect_count += 1
                 truncated_intervals = truncated_intervals | intervals
 
-            if search_count > max_iter:
+            if search_count > self.max_iter:
                 raise InfiniteLoopError(LoopType.ITER)
             if searched_intervals == before_searched_intervals:
                 raise InfiniteLoopError(LoopType.SAME)
@@ -365,14 +406,38 @@ class SelectiveInference:
         float
             The p-value from the truncated intervals.
         """
-        absolute = self.alternative == "two-sided"
         cdf_value = truncated_cdf(
             self.null_rv,
             self.stat,
             truncated_intervals,
-            absolute=absolute,
+            absolute=self._absolute,
+            median=self._median,
         )
-        return self._convert_cdf_value_to_pvalue(cdf_value)
+        return self._cdf_value_to_pvalue(cdf_value)
+
+    def _unsearched_intervals(self, searched_intervals: RealSubset) -> RealSubset:
+        """Take the unsearched intervals in the support.
+
+        The value for the last given searched intervals is memoized.
+
+        Parameters
+        ----------
+        searched_intervals : RealSubset
+            The searched intervals.
+
+        Returns
+        -------
+        RealSubset
+            The unsearched intervals.
+        """
+        if self._last_unsearched is not None:
+            last_searched, unsearched_intervals = self._last_unsearched
+            if last_searched is searched_intervals:
+                return unsearched_intervals
+
+        unsearched_intervals = self.support - searched_intervals
+        self._last_unsearched = (searched_intervals, unsearched_intervals)
+        return unsearched_intervals
 
     def _evaluate_pvalue_bounds(
         self,
@@ -393,60 +458,42 @@ class SelectiveInference:
         tuple[float, float]
             The lower and upper bounds of the p-value.
         """
-        absolute = self.alternative == "two-sided"
-        if absolute:
-            mask_intervals = RealSubset([[-np.abs(self.stat), np.abs(self.stat)]])
+        truncated_in_support = truncated_intervals & self.support
+        unsearched_intervals = self._unsearched_intervals(searched_intervals)
+
+        if self._last_bounds is not None:
+            last_truncated, last_unsearched, inf_p, sup_p = self._last_bounds
+            if np.array_equal(
+                last_truncated.intervals,
+                truncated_in_support.intervals,
+            ) and np.array_equal(
+                last_unsearched.intervals,
+                unsearched_intervals.intervals,
+            ):
+                return inf_p, sup_p
+
+        if unsearched_intervals.is_empty():
+            # the whole support has been searched, so both bounds coincide
+            inf_p = sup_p = self._compute_pvalue(truncated_in_support)
         else:
-            mask_intervals = RealSubset([[-np.inf, self.stat]])
-
-        unsearched_intervals = ~searched_intervals
-
-        inf_intervals = truncated_intervals | (unsearched_intervals - mask_intervals)
-        sup_intervals = truncated_intervals | (unsearched_intervals & mask_intervals)
-
-        inf_intervals = inf_intervals & self.support
-        sup_intervals = sup_intervals & self.support
-
-        inf_cdf = truncated_cdf(
-            self.null_rv,
-            self.stat,
-            inf_intervals,
-            absolute=absolute,
-        )
-        sup_cdf = truncated_cdf(
-            self.null_rv,
-            self.stat,
-            sup_intervals,
-            absolute=absolute,
-        )
+            # both the extreme cdf values share the areas of the truncated intervals
+            p_values = [
+                self._cdf_value_to_pvalue(cdf_value)
+                for cdf_value in truncated_cdf_range(
+                    self.null_rv,
+                    self.stat,
+                    truncated_in_support,
+                    unsearched_intervals,
+                    absolute=self._absolute,
+                    mask_intervals=self._mask_intervals,
+                    median=self._median,
+                )
+            ]
+            inf_p, sup_p = min(p_values), max(p_values)
 
-        p_value_from_inf = self._convert_cdf_value_to_pvalue(inf_cdf)
-        p_value_from_sup = self._convert_cdf_value_to_pvalue(sup_cdf)
-        inf_p, sup_p = np.sort([p_value_from_inf, p_value_from_sup])
+        self._last_bounds = (truncated_in_support, unsearched_intervals, inf_p, sup_p)
         return inf_p, sup_p
 
-    def _convert_cdf_value_to_pvalue(
-        self,
-        cdf_value: float,
-    ) -> float:
-        """Convert the CDF value to the p-value.
-
-        Parameters
-        ----------
-        cdf_value : float
-            The CDF value.
-
-        Returns
-        -------
-        float
-            The p-value.
-        """
-        match self.alternative:
-            case "two-sided" | "less":
-                return float(1.0 - cdf_value)
-            case "greater":
-                return float(cdf_value)
-
     def _create_search_strategy(
         self,
         inference_mode: Literal["parametric", "exhaustive", "over_conditioning"],
@@ -470,12 +517,20 @@ class SelectiveInference:
             The search strategy.
         """
         match inference_mode:
-            case "exhaustive", _:
-                return lambda searched_intervals: (
-                    self.limits.intervals[0][0]
-                    if searched_intervals.is_empty()
-                    else searched_intervals.intervals[0][1] + self.step
-                )
+            case "exhaustive":
+
+                def search_strategy(searched_intervals: RealSubset) -> float:
+                    if searched_intervals.is_empty():
+                        return self.limits.intervals[0][0]
+                    # step into the first unsearched interval in the limits, or
+                    # take its midpoint if it is not wider than the step
+                    remaining_intervals = self.limits - searched_intervals
+                    left_end, right_end = remaining_intervals.intervals[0]
+                    if left_end + self.step < right_end:
+                        return left_end + self.step
+                    return (left_end + right_end) / 2.0
+
+                return search_strategy
 
             case "over_conditioning":
                 return lambda _: self.stat
@@ -486,34 +541,41 @@ class SelectiveInference:
 
                 def metric(z: list[float]) -> list[float]:
                     return np.abs(np.array(z) - self.stat)
-            case "pi2":
-                target_value = self.mode
+            case "pi2" | "pi3":
+                target_value = self.mode if search_strategy_name == "pi2" else self.stat
 
                 def metric(z: list[float]) -> list[float]:
                     return -self.null_rv.logpdf(np.array(z))
-            case "pi3":
-                target_value = self.stat
 
-                def metric(z: list[float]) -> list[float]:
-                    return -self.null_rv.logpdf(np.array(z))
+        # step sizes tried from each edge, from the largest to the smallest
+        min_step = 1e-11
+        num_steps = max(int(np.ceil(np.log10(self.step / min_step))), 0) + 1
+        steps = self.step / 10.0 ** np.arange(num_steps)
+        steps = steps[steps > min_step]
 
         def search_strategy(searched_intervals: RealSubset) -> float:
             if searched_intervals.is_empty():
                 return self.stat
-            unsearched_intervals = self.support - searched_intervals
+            unsearched_intervals = self._unsearched_intervals(searched_intervals)
             if target_value in unsearched_intervals:
                 return target_value
 
-            candidates, min_step = [], 1e-11
+            candidates = []
             l, u = searched_intervals.find_interval_containing(target_value)
-            for candidate, step_ in [(l, -self.step), (u, self.step)]:
-                step = step_
-                if candidate in unsearched_intervals and np.isfinite(candidate):
-                    while np.abs(step) > min_step:
-                        if candidate + step in unsearched_intervals:
-                            candidates.append(candidate + step)
-                            break
-                        step /= 10
+            for edge, sign in [(l, -1.0), (u, 1.0)]:
+                if math.isfinite(edge) and edge in unsearched_intervals:
+                    # place the candidate in the unsearched interval adjacent to
+                    # the edge with the largest step that fits in it
+                    left_end, right_end = unsearched_intervals.find_interval_containing(
+                        edge,
+                    )
+                    points = edge + sign * steps
+                    hits = points[(left_end <= points) & (points <= right_end)]
+                    if len(hits) > 0:
+                        candidates.append(hits[0])
+            if len(candidates) == 1:
+                # nothing to compare, so skip the evaluation of the metric
+                return candidates[0]
             return np.array(candidates)[np.argmin(metric(candidates))]
 
         return search_strategy
@@ -550,14 +612,15 @@ class SelectiveInference:
                     bar: tqdm | None = None,
                 ) -> bool:
                     _ = truncated_intervals
-                    flag = self.limits <= searched_intervals
+                    remaining_intervals = self.limits - searched_intervals
+                    flag = remaining_intervals.is_empty()
                     if bar is not None:
                         if flag:
                             bar.update(bar.total - bar.n)
                         else:
-                            ratio = (
-                                searched_intervals & self.limits
-                            ).measure / self.limits.measure
+                            ratio = 1.0 - (
+                                remaining_intervals.measure / self.limits.measure
+                            )
                             bar.update(bar.total * ratio - bar.n)
                     return flag
 
@@ -586,14 +649,14 @@ class SelectiveInference:
                         searched_intervals,
                         truncated_intervals,
                     )
-                    value = np.abs(sup_p - inf_p)
+                    value = abs(sup_p - inf_p)
                     if bar is not None:
                         shift = 0.001
                         start, end = 1.0, self.precision
                         scale = 1.0 / np.log((end + shift) / (start + shift))
                         bias = -scale * np.log(start + shift)
                         current = bar.total * (
-                            scale * np.log(np.max([value, end]) + shift) + bias
+                            scale * np.log(max(value, end) + shift) + bias
                         )
                         bar.update(current - bar.n)
                     return value < self.precision
@@ -607,19 +670,19 @@ class SelectiveInference:
                     truncated_intervals: RealSubset,
                     bar: tqdm | None = None,
                 ) -> bool:
+                    alpha = self.significance_level
                     inf_p, sup_p = self._evaluate_pvalue_bounds(
                         searched_intervals,
                         truncated_intervals,
                     )
-                    alpha = self.significance_level
-                    value = np.min([alpha - inf_p, sup_p - alpha])
+                    value = min(alpha - inf_p, sup_p - alpha)
                     if bar is not None:
                         shift = 0.001
-                        start, end = np.min([alpha, 1.0 - alpha]), 0.0
+                        start, end = min(alpha, 1.0 - alpha), 0.0
                         scale = 1.0 / np.log((end + shift) / (start + shift))
                         bias = -scale * np.log(start + shift)
                         current = bar.total * (
-                            scale * np.log(np.max([value, end]) + shift) + bias
+                            scale * np.log(max(value, end) + shift) + bias
                         )
                         bar.update(current - bar.n)
                     return value < 0.0
@@ -661,20 +724,19 @@ class SelectiveInference:
         SelectiveInferenceResult
             The result of the selective inference.
         """
-        interval_list = []
-        current_point = self.limits.intervals[0][0]
-        length = self.limits.intervals[0][1] - self.limits.intervals[0][0]
-        each_length = length / n_jobs
-        for _ in range(n_jobs):
-            interval = RealSubset([[current_point, current_point + each_length]])
-            interval_list.append(interval)
-            current_point += each_length
-
-        searched_intervals = RealSubset()
-        truncated_intervals = RealSubset()
-        search_count, detect_count = 0, 0
-
-        with Parallel(n_jobs=n_jobs) as parallel:
+        # resolve negative values such as -1 into the actual number of workers
+        n_jobs = effective_n_jobs(n_jobs)
+
+        # split the limits without accumulating rounding errors, so that adjacent
+        # chunks share their end points exactly and the last one ends at the limit
+        lower, upper = self.limits.intervals[0]
+        boundaries = np.linspace(lower, upper, n_jobs + 1)
+        interval_list = [
+            RealSubset([[left, right]]) for left, right in pairwise(boundaries)
+        ]
+
+        # each job is a long-running search, so dispatch them one by one
+        with Parallel(n_jobs=n_jobs, batch_size=1) as parallel:
             results = parallel(
                 delayed(_search_interval)(
                     algorithm,
@@ -683,22 +745,24 @@ class SelectiveInference:
                     self.a,
                     self.b,
                     each_interval,
+                    max_iter=self.max_iter,
                     job_id=job_id,
                     progress=progress,
                 )
                 for job_id, each_interval in enumerate(interval_list)
             )
-        for result in results:
-            (
-                searched_intervals_,
-                truncated_intervals_,
-                search_count_,
-                detect_count_,
-            ) = result
-            searched_intervals = searched_intervals | searched_intervals_
-            truncated_intervals = truncated_intervals | truncated_intervals_
-            search_count += search_count_
-            detect_count += detect_count_
+        searched_list, truncated_list, search_counts, detect_counts = zip(
+            *results,
+            strict=True,
+        )
+        # merge the results of all jobs at once instead of one union per job
+        searched_intervals = RealSubset(
+            np.vstack([intervals.intervals for intervals in searched_list]),
+        )
+        truncated_intervals = RealSubset(
+            np.vstack([intervals.intervals for intervals in truncated_list]),
+        )
+        search_count, detect_count = sum(search_counts), sum(detect_counts)
 
         return SelectiveInferenceResult(
             self.stat,
@@ -713,6 +777,63 @@ class SelectiveInference:
         )
 
 
+def _logcdf(rv: rv_continuous, z: float, *, upper: bool = False) -> float:
+    """Compute the logarithm of the cdf or the survival function at a single value.
+
+    For the standard normal distribution, the special function is called
+    directly to skip the argument handling of the rv_continuous instance.
+
+    Parameters
+    ----------
+    rv : rv_continuous
+        The rv_continuous instance.
+    z : float
+        The value at which to compute the function.
+    upper : bool, optional
+        Whether to compute the survival function instead of the cdf. Defaults to False.
+
+    Returns
+    -------
+    float
+        The logarithm of the cdf or the survival function at z.
+    """
+    if isinstance(rv.dist, type(norm)) and not rv.args and not rv.kwds:
+        return log_ndtr(-z if upper else z)
+    return rv.logsf(z) if upper else rv.logcdf(z)
+
+
+def _upper_tail_pvalue(cdf_value: float) -> float:
+    """Convert the CDF value to the p-value of the right-tailed test.
+
+    Parameters
+    ----------
+    cdf_value : float
+        The CDF value.
+
+    Returns
+    -------
+    float
+        The p-value.
+    """
+    return float(1.0 - cdf_value)
+
+
+def _lower_tail_pvalue(cdf_value: float) -> float:
+    """Convert the CDF value to the p-value of the left-tailed test.
+
+    Parameters
+    ----------
+    cdf_value : float
+        The CDF value.
+
+    Returns
+    -------
+    float
+        The p-value.
+    """
+    return float(cdf_value)
+
+
 def _search_interval(
     algorithm: Callable[
         [np.ndarray, np.ndarray, float],
@@ -724,6 +845,7 @@ def _search_interval(
     b: np.ndarray,
     each_interval: RealSubset,
     *,
+    max_iter: int,
     job_id: int,
     progress: bool = False,
 ) -> tuple[RealSubset, RealSubset, int, int]:
@@ -747,11 +869,18 @@ def _search_interval(
         Search direction vector, whose shape is same to the data.
     each_interval : RealSubset
         The interval for the search.
+    max_iter : int
+        Maximum number of iterations.
     job_id : int
         Job ID for the parallel processing.
     progress : bool, optional
         Whether to show the progress bar. Defaults to `False`.
 
+    Raises
+    ------
+    InfiniteLoopError
+        If the search is performed more than `max_iter` times.
+
     Returns
     -------
     tuple[RealSubset, RealSubset, int, int]
@@ -772,9 +901,11 @@ def _search_interval(
             bar_format="{desc}: {percentage:3.2f}{unit}|{bar}| [{elapsed}<{remaining}, {rate_fmt}{postfix}]",
         )
 
+    bound_algorithm = partial(algorithm, a, b)
+
     z = each_interval.intervals[0][0]
     while True:
-        model, intervals_ = algorithm(a, b, z)
+        model, intervals_ = bound_algorithm(z)
         intervals = (
             intervals_ if isinstance(intervals_, RealSubset) else RealSubset(intervals_)
         )
@@ -784,6 +915,8 @@ def _search_interval(
             detect_count += 1
             truncated_intervals = truncated_intervals | intervals
 
+        if search_count > max_iter:
+            raise InfiniteLoopError(LoopType.ITER)
         if each_interval <= searched_intervals:
             if progress:
                 bar.update(total - bar.n)
@@ -1,7 +1,6 @@
 """Module providing the cumulative distribution functions."""
 
 import numpy as np
-from scipy.special import logsumexp  # type: ignore[import]
 from scipy.stats import chi, norm, rv_continuous  # type: ignore[import]
 
 from .real_subset import NotBelongToSubsetError, RealSubset
@@ -13,6 +12,7 @@ def truncated_cdf(
     intervals: np.ndarray | list[list[float]] | RealSubset,
     *,
     absolute: bool = False,
+    median: float | None = None,
 ) -> float:
     """Compute the cdf value of the truncated distribution.
 
@@ -27,6 +27,9 @@ def truncated_cdf(
     absolute : bool, optional
         Whether to compute the cdf for the distribution of the
         absolute value of the random variable. Defaults to False.
+    median : float | None, optional
+        The median of the distribution `rv`, which can be given to avoid computing
+        it in repeated calls. Defaults to None.
 
     Returns
     -------
@@ -50,44 +53,192 @@ def truncated_cdf(
         else RealSubset([[-np.inf, z]])
     )
 
-    inner_intervals = intervals & mask_intervals
-    outer_intervals = intervals - mask_intervals
+    inner_log_area, outer_log_area = _compute_log_areas(
+        rv,
+        [intervals & mask_intervals, intervals - mask_intervals],
+        median=median,
+    )
+    return _cdf_from_log_areas(inner_log_area, outer_log_area)
+
+
+def truncated_cdf_range(
+    rv: rv_continuous,
+    z: float,
+    truncated_intervals: RealSubset,
+    unsearched_intervals: RealSubset,
+    *,
+    absolute: bool = False,
+    mask_intervals: RealSubset | None = None,
+    median: float | None = None,
+) -> tuple[float, float]:
+    """Compute the range of the cdf value of the truncated distribution.
+
+    The unsearched intervals may or may not be truncated, and the cdf value is
+    minimized (maximized) when only their parts outside (inside) of the mask
+    intervals are truncated. Both the extremes are computed from the four
+    areas of the truncated and unsearched intervals inside and outside of the mask.
+
+    Parameters
+    ----------
+    rv : rv_continuous
+        The rv_continuous instance to be truncated.
+    z : float
+        The value at which to compute the cdf of the truncated distribution.
+    truncated_intervals : RealSubset
+        The intervals known to be truncated.
+    unsearched_intervals : RealSubset
+        The intervals not known to be truncated or not, disjoint from the
+        truncated intervals.
+    absolute : bool, optional
+        Whether to compute the cdf for the distribution of the
+        absolute value of the random variable. Defaults to False.
+    mask_intervals : RealSubset | None, optional
+        The intervals below z, i.e., [[-|z|, |z|]] if `absolute` is True and
+        [[-inf, z]] otherwise, which can be given to avoid building them in
+        repeated calls. Defaults to None.
+    median : float | None, optional
+        The median of the distribution `rv`, which can be given to avoid computing
+        it in repeated calls. Defaults to None.
+
+    Returns
+    -------
+    tuple[float, float]
+        The minimum and maximum of the cdf value at z.
+
+    Raises
+    ------
+    ValueError
+        If the value z is not belong to the truncated or unsearched intervals.
+    """
+    # z may not have been searched yet, and then it belongs to both of the
+    # extremes of the truncated intervals through its closed end point
+    if z not in truncated_intervals and z not in unsearched_intervals:
+        raise NotBelongToSubsetError(z, truncated_intervals | unsearched_intervals)
+
+    if mask_intervals is None:
+        mask_intervals = (
+            RealSubset([[-np.abs(z), np.abs(z)]])
+            if absolute
+            else RealSubset([[-np.inf, z]])
+        )
+
+    truncated_inner, truncated_outer, unsearched_inner, unsearched_outer = (
+        _compute_log_areas(
+            rv,
+            [
+                truncated_intervals & mask_intervals,
+                truncated_intervals - mask_intervals,
+                unsearched_intervals & mask_intervals,
+                unsearched_intervals - mask_intervals,
+            ],
+            median=median,
+        )
+    )
+    return (
+        _cdf_from_log_areas(
+            truncated_inner,
+            np.logaddexp(truncated_outer, unsearched_outer),
+        ),
+        _cdf_from_log_areas(
+            np.logaddexp(truncated_inner, unsearched_inner),
+            truncated_outer,
+        ),
+    )
 
-    inner_log_area = _compute_log_area(rv, inner_intervals)
-    outer_log_area = _compute_log_area(rv, outer_intervals)
+
+def _cdf_from_log_areas(inner_log_area: float, outer_log_area: float) -> float:
+    """Compute the cdf value from the logarithms of the areas inside and outside of the mask.
+
+    Parameters
+    ----------
+    inner_log_area : float
+        The logarithm of the area inside of the mask.
+    outer_log_area : float
+        The logarithm of the area outside of the mask.
+
+    Returns
+    -------
+    float
+        The cdf value.
+    """
     # equal to 1.0 / (1.0 + np.exp(outer_log_area - inner_log_area))
     return np.exp(-np.log1p(np.exp(outer_log_area - inner_log_area)))
 
 
-def _compute_log_area(rv: rv_continuous, intervals: RealSubset) -> float:
-    """Compute the logarithm of the integral of the pdf over the each interval.
+def _compute_log_areas(
+    rv: rv_continuous,
+    intervals_list: list[RealSubset],
+    *,
+    median: float | None = None,
+) -> np.ndarray:
+    """Compute the logarithms of the integrals of the pdf over the each subset.
+
+    The end points of all the subsets are evaluated together, so that the
+    distribution is called at most once for each of the logcdf and logsf.
 
     Parameters
     ----------
     rv : rv_continuous
         The rv_continuous instance to be integrated.
-    intervals : RealSubset
-        The intervals on which to compute the integral.
+    intervals_list : list[RealSubset]
+        The subsets on which to compute the integrals.
+    median : float | None, optional
+        The median of the distribution `rv`, computed if not given. Defaults to None.
 
     Returns
     -------
-    float
-        The logarithm of the integral.
+    np.ndarray
+        The logarithms of the integrals for the each subset.
     """
-    left_ends, right_ends = intervals.intervals.T
+    intervals = np.vstack([each.intervals for each in intervals_list])
     log_each_area = np.empty(len(intervals))
-    mask = left_ends < rv.median()
+    if median is None:
+        median = rv.median()
+    mask = intervals[:, 0] < median
+
+    # evaluate both end points of the intervals in a single call per function
+    if np.any(mask):
+        left_log_cdf, right_log_cdf = rv.logcdf(intervals[mask].T)
+        log_each_area[mask] = right_log_cdf + _log1mexp(left_log_cdf - right_log_cdf)
+
+    if not np.all(mask):
+        left_log_sf, right_log_sf = rv.logsf(intervals[~mask].T)
+        log_each_area[~mask] = left_log_sf + _log1mexp(right_log_sf - left_log_sf)
+
+    # pad the areas of the each subset with zeros to sum them up at once
+    # keep at least one column so that the empty subsets have zero areas
+    lengths = [len(each) for each in intervals_list]
+    width = max(*lengths, 1)
+    padded = np.full((len(lengths), width), -np.inf)
+    padded[np.arange(width) < np.array(lengths)[:, None]] = log_each_area
+    return _logsumexp_rows(padded)
 
-    left_log_cdf, right_log_cdf = (
-        rv.logcdf(left_ends[mask]),
-        rv.logcdf(right_ends[mask]),
-    )
-    log_each_area[mask] = right_log_cdf + _log1mexp(left_log_cdf - right_log_cdf)
 
-    left_log_sf, right_log_sf = rv.logsf(left_ends[~mask]), rv.logsf(right_ends[~mask])
-    log_each_area[~mask] = left_log_sf + _log1mexp(right_log_sf - left_log_sf)
+def _logsumexp_rows(log_values: np.ndarray) -> np.ndarray:
+    """Compute the logarithm of the sum of the exponentials for the each row.
+
+    This is equivalent to `scipy.special.logsumexp(log_values, axis=1)` for the
+    values not greater than zero, without its overhead for the general inputs.
+
+    Parameters
+    ----------
+    log_values : np.ndarray
+        Input values in 2D array, which may contain -np.inf.
+
+    Returns
+    -------
+    np.ndarray
+        The logarithm of the sum of the exponentials for the each row.
+    """
+    rows = np.arange(len(log_values))
+    argmax = np.argmax(log_values, axis=1)
+    max_values = log_values[rows, argmax]
+    shifts = np.where(np.isfinite(max_values), max_values, 0.0)
 
-    return logsumexp(log_each_area)
+    # separate the largest terms from the sum for the precision
+    others = log_values.copy()
+    others[rows, argmax] = -np.inf
+    return np.log1p(np.sum(np.exp(others - shifts[:, None]), axis=1)) + max_values
 
 
 def _log1mexp(z: np.ndarray) -> np.ndarray:
@@ -104,12 +255,9 @@ def _log1mexp(z: np.ndarray) -> np.ndarray:
         Logarithm of one minus the exponential of the input array.
     """
     z = np.asarray(z)
-    values = np.empty_like(z)
     halflog = -0.693147  # equal to log(0.5)
-    mask = z < halflog
-    values[mask] = np.log1p(-np.exp(z[mask]))
-    values[~mask] = np.log(-np.expm1(z[~mask]))
-    return values
+    # both expressions are defined for all z <= 0, so select instead of masking
+    return np.where(z < halflog, np.log1p(-np.exp(z)), np.log(-np.expm1(z)))
 
 
 def truncated_norm_cdf(
@@ -5,8 +5,17 @@ from __future__ import annotations
 import numpy as np
 from typing_extensions import Self
 
+# the largest number of pairs of intervals for which the intersection is taken
+# by intersecting all the pairs at once instead of the overlapping pairs only
+_MAX_INTERSECTING_PAIRS = 4096
 
-def simplify(intervals: np.ndarray, tol: float = 1e-10) -> np.ndarray:
+
+def simplify(
+    intervals: np.ndarray,
+    tol: float = 1e-10,
+    *,
+    is_sorted: bool = False,
+) -> np.ndarray:
     """Simplify (merge overlapping) the intervals.
 
     Parameters
@@ -16,6 +25,9 @@ def simplify(intervals: np.ndarray, tol: float = 1e-10) -> np.ndarray:
     tol : float, optional
         Tolerance error parameter. When `tol`>=0.1, the intervals [[0, 1], [1.1, 2]]
         will be simplified to [[0, 2]]. Defaults to 1e-10.
+    is_sorted : bool, optional
+        Whether the intervals are already sorted by their lower ends, in which case
+        they are merged without being sorted again. Defaults to False.
 
     Returns
     -------
@@ -24,15 +36,40 @@ def simplify(intervals: np.ndarray, tol: float = 1e-10) -> np.ndarray:
     """
     if len(intervals) == 0:
         return np.array([]).reshape(0, 2)
+    if is_sorted:
+        return _coalesce(intervals, tol)
 
-    intervals = intervals[np.argsort(intervals[:, 0])]
-    simplified = [intervals[0]]
-    for interval in intervals[1:]:
-        if interval[0] <= simplified[-1][1] + tol:
-            simplified[-1][1] = np.max([simplified[-1][1], interval[1]])
-        else:
-            simplified.append(interval)
-    return np.array(simplified)
+    # already sorted and separated by more than tol, which is the usual case
+    # for the intervals returned by the algorithm and the set operations
+    left_ends, right_ends = intervals[1:, 0], intervals[:-1, 1]
+    if np.all(left_ends > intervals[:-1, 0]) and np.all(left_ends > right_ends + tol):
+        return intervals.copy()
+
+    return _coalesce(intervals[np.argsort(intervals[:, 0])], tol)
+
+
+def _coalesce(intervals: np.ndarray, tol: float = 1e-10) -> np.ndarray:
+    """Merge the overlapping intervals sorted by their lower ends.
+
+    Parameters
+    ----------
+    intervals : np.ndarray
+        Non-empty intervals [[l1, u1], [l2, u2], ...] sorted by the lower ends.
+    tol : float, optional
+        Tolerance error parameter. The intervals whose gap is not greater than
+        `tol` are merged. Defaults to 1e-10.
+
+    Returns
+    -------
+    np.ndarray
+        Merged intervals [[l1', u1'], [l2', u2'], ...].
+    """
+    # an interval starts a new group when it is apart from all the former ones
+    upper_ends = np.maximum.accumulate(intervals[:, 1])
+    is_start = np.concatenate([[True], intervals[1:, 0] > upper_ends[:-1] + tol])
+    starts = np.flatnonzero(is_start)
+    stops = np.append(starts[1:], len(intervals)) - 1
+    return np.column_stack([intervals[starts, 0], upper_ends[stops]])
 
 
 def complement(intervals: np.ndarray) -> np.ndarray:
@@ -50,19 +87,18 @@ def complement(intervals: np.ndarray) -> np.ndarray:
     """
     if len(intervals) == 0 or len(intervals[0]) == 0:
         return np.array([[-np.inf, np.inf]])
+    intervals = np.asarray(intervals)
 
-    result = []
-    if intervals[0][0] > -np.inf:
-        result.append([-np.inf, intervals[0][0]])
-
-    result += [
-        [intervals[i][1], intervals[i + 1][0]] for i in range(len(intervals) - 1)
-    ]
-
-    if intervals[-1][1] < np.inf:
-        result.append([intervals[-1][1], np.inf])
-
-    return simplify(np.array(result))
+    # the gaps before, between, and after the intervals
+    gaps = np.column_stack(
+        [
+            np.concatenate([[-np.inf], intervals[:, 1]]),
+            np.concatenate([intervals[:, 0], [np.inf]]),
+        ],
+    )
+    start = 1 if intervals[0][0] == -np.inf else 0
+    stop = len(gaps) - 1 if intervals[-1][1] == np.inf else len(gaps)
+    return simplify(gaps[start:stop])
 
 
 def union(intervals1: np.ndarray, intervals2: np.ndarray) -> np.ndarray:
@@ -99,7 +135,127 @@ def intersection(intervals1: np.ndarray, intervals2: np.ndarray) -> np.ndarray:
     np.ndarray
         Intersection of the two input intervals [[l1', u1'], [l2', u2'], ...].
     """
-    return complement(union(complement(intervals1), complement(intervals2)))
+    intervals1 = simplify(np.asarray(intervals1).reshape(-1, 2))
+    intervals2 = simplify(np.asarray(intervals2).reshape(-1, 2))
+    return _intersect(intervals1, intervals2)
+
+
+def _intersect(
+    intervals1: np.ndarray,
+    intervals2: np.ndarray,
+    tol: float = 1e-10,
+) -> np.ndarray:
+    """Take the intersection of two simplified intervals by intersecting the pairs.
+
+    Parameters
+    ----------
+    intervals1 : np.ndarray
+        Simplified intervals [[l1, u1], [l2, u2], ...].
+    intervals2 : np.ndarray
+        Simplified intervals [[l1, u1], [l2, u2], ...].
+    tol : float, optional
+        Tolerance error parameter. The resulting intervals whose length is not
+        greater than `tol` are removed, as taking the complements does.
+        Defaults to 1e-10.
+
+    Returns
+    -------
+    np.ndarray
+        Intersection of the two input intervals [[l1', u1'], [l2', u2'], ...].
+    """
+    if len(intervals1) * len(intervals2) <= _MAX_INTERSECTING_PAIRS:
+        # both operands are sorted, so the row-major order of the pairs is sorted
+        left_ends = np.maximum.outer(intervals1[:, 0], intervals2[:, 0], dtype=float)
+        right_ends = np.minimum.outer(intervals1[:, 1], intervals2[:, 1], dtype=float)
+        mask = right_ends > left_ends + tol
+        return np.column_stack([left_ends[mask], right_ends[mask]])
+
+    # only the intervals of the first operand in [starts[j], stops[j])
+    # can overlap the j-th interval of the second operand
+    starts = np.searchsorted(intervals1[:, 1], intervals2[:, 0], side="right")
+    stops = np.searchsorted(intervals1[:, 0], intervals2[:, 1], side="left")
+    counts = np.maximum(stops - starts, 0)
+
+    # enumerate the overlapping pairs in sorted order
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    indices1 = np.arange(np.sum(counts)) + offsets
+    indices2 = np.repeat(np.arange(len(intervals2)), counts)
+
+    left_ends = np.maximum(
+        intervals1[indices1, 0],
+        intervals2[indices2, 0],
+        dtype=float,
+    )
+    right_ends = np.minimum(
+        intervals1[indices1, 1],
+        intervals2[indices2, 1],
+        dtype=float,
+    )
+    mask = right_ends > left_ends + tol
+    return np.column_stack([left_ends[mask], right_ends[mask]])
+
+
+def _insert(
+    intervals: np.ndarray,
+    lower: float,
+    upper: float,
+    tol: float = 1e-10,
+) -> np.ndarray:
+    """Take the union of simplified intervals and a single interval.
+
+    Parameters
+    ----------
+    intervals : np.ndarray
+        Simplified intervals [[l1, u1], [l2, u2], ...].
+    lower : float
+        Lower end of the single interval.
+    upper : float
+        Upper end of the single interval.
+    tol : float, optional
+        Tolerance error parameter. The intervals whose gap from the single interval
+        is not greater than `tol` are merged, as `simplify` does. Defaults to 1e-10.
+
+    Returns
+    -------
+    np.ndarray
+        Union of the intervals and the single interval [[l1', u1'], ...].
+    """
+    # only the intervals in [start, stop) touch the single interval
+    start = np.searchsorted(intervals[:, 1] + tol, lower, side="left")
+    stop = np.searchsorted(intervals[:, 0], upper + tol, side="right")
+    if start < stop:
+        lower = min(lower, intervals[start, 0])
+        upper = max(upper, intervals[stop - 1, 1])
+    return np.vstack([intervals[:start], [[lower, upper]], intervals[stop:]])
+
+
+def _merge(
+    intervals1: np.ndarray,
+    intervals2: np.ndarray,
+    tol: float = 1e-10,
+) -> np.ndarray:
+    """Take the union of two simplified intervals.
+
+    Parameters
+    ----------
+    intervals1 : np.ndarray
+        Simplified intervals [[l1, u1], [l2, u2], ...].
+    intervals2 : np.ndarray
+        Simplified intervals [[l1, u1], [l2, u2], ...].
+    tol : float, optional
+        Tolerance error parameter. The intervals whose gap is not greater than
+        `tol` are merged, as `simplify` does. Defaults to 1e-10.
+
+    Returns
+    -------
+    np.ndarray
+        Union of the two input intervals [[l1', u1'], [l2', u2'], ...].
+    """
+    intervals = np.vstack([intervals1, intervals2])
+    if len(intervals) == 0:
+        return intervals
+    # the stable sort finds the two sorted runs and merges them in linear time
+    return _coalesce(intervals[np.argsort(intervals[:, 0], kind="stable")], tol)
 
 
 class RealSubset:
@@ -155,10 +311,11 @@ class RealSubset:
         """
         if intervals is None:
             self.intervals = np.array([]).reshape(0, 2)
+        elif is_simplify:
+            # simplify always returns a new array, so avoid copying the input twice
+            self.intervals = simplify(np.asarray(intervals).reshape(-1, 2))
         else:
             self.intervals = np.array(intervals).reshape(-1, 2)
-            if is_simplify:
-                self.simplify()
 
     def simplify(self) -> None:
         """Simplify the intervals of the subset."""
@@ -197,7 +354,13 @@ class RealSubset:
         RealSubset
             Union of the two subsets.
         """
-        return RealSubset(union(self.intervals, other.intervals), is_simplify=False)
+        fewer, more = (other, self) if len(other) <= len(self) else (self, other)
+        if len(fewer) == 1:
+            # adding a single interval, which is the usual case in the search,
+            # only needs to merge its neighbors instead of sorting all
+            lower, upper = fewer.intervals[0]
+            return RealSubset(_insert(more.intervals, lower, upper), is_simplify=False)
+        return RealSubset(_merge(self.intervals, other.intervals), is_simplify=False)
 
     def __or__(self, other: RealSubset) -> RealSubset:
         """Take the union.
@@ -253,7 +416,10 @@ class RealSubset:
         RealSubset
             Intersection of the two subsets.
         """
-        return ~((~self) | (~other))
+        return RealSubset(
+            _intersect(self.intervals, other.intervals),
+            is_simplify=False,
+        )
 
     def __and__(self, other: RealSubset) -> RealSubset:
         """Take the intersection.
@@ -433,8 +599,13 @@ class RealSubset:
         """
         if not isinstance(other, RealSubset):
             return False
+        if self is other or self.intervals is other.intervals:
+            return True
         if self.intervals.shape != other.intervals.shape:
             return False
+        # exact comparison settles the usual cases without the tolerance check
+        if np.array_equal(self.intervals, other.intervals):
+            return True
         return np.allclose(self.intervals, other.intervals, rtol=1e-12, atol=1e-12)
 
     def issubset(self, other: RealSubset) -> bool:
@@ -555,9 +726,7 @@ class RealSubset:
         bool
             True if z is in the subset, False otherwise.
         """
-        if len(self.intervals) == 0:
-            return False
-        return np.any((self.intervals[:, 0] <= z) & (z <= self.intervals[:, 1])).item()
+        return self._find_index(z) >= 0
 
     def find_interval_containing(self, z: float) -> list[float]:
         """Find the interval containing a real number.
@@ -577,12 +746,31 @@ class RealSubset:
         ValueError
             If the subset is empty or no interval contains z.
         """
-        if len(self.intervals) == 0:
+        index = self._find_index(z)
+        if index < 0:
             raise NotBelongToSubsetError(z, self)
-        mask = (self.intervals[:, 0] <= z) & (z <= self.intervals[:, 1])
-        if np.sum(mask) == 0:
-            raise NotBelongToSubsetError(z, self)
-        return self.intervals[mask][0].tolist()
+        return self.intervals[index].tolist()
+
+    def _find_index(self, z: float) -> int:
+        """Find the index of the interval containing a real number.
+
+        Since the intervals are sorted and disjoint, only the last interval
+        whose left end is not greater than z can contain z.
+
+        Parameters
+        ----------
+        z : float
+            Real number to find the interval containing it.
+
+        Returns
+        -------
+        int
+            Index of the interval containing z, or -1 if no interval contains z.
+        """
+        index = int(np.searchsorted(self.intervals[:, 0], z, side="right")) - 1
+        if index >= 0 and z <= self.intervals[index, 1]:
+            return index
+        return -1
 
     def tolist(self) -> list[list[float]]:
         """Return the intervals as a list of lists.
@@ -625,7 +813,8 @@ class RealSubset:
         """
         if len(self.intervals) == 0:
             return "[]"
-        return "[" + ", ".join([f"[{l:.6f}, {u:.6f}]" for l, u in self.intervals]) + "]"
+        template = ", ".join(["[{:.6f}, {:.6f}]"] * len(self.intervals))
+        return "[" + template.format(*self.intervals.ravel().tolist()) + "]"
 
     def __repr__(self) -> str:
         """Return a string representation that can be used to recreate the object.
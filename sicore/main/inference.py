@@ -107,10 +107,10 @@ class SelectiveInferenceNorm(SelectiveInference):
             if isinstance(var, float):
                 sigma_eta = var * eta
             elif len(var.shape) == 1:
-                diag_cov = tf.constant(var, dtype=data.dtype)
+                diag_cov = tf.convert_to_tensor(var, dtype=data.dtype)
                 sigma_eta = diag_cov * eta
             else:
-                cov = tf.constant(var, dtype=data.dtype)
+                cov = tf.convert_to_tensor(var, dtype=data.dtype)
                 sigma_eta = tf.tensordot(cov, eta, axes=1)
             eta_sigma_eta = tf.tensordot(eta, sigma_eta, axes=1)
             sqrt_eta_sigma_eta = tf.sqrt(eta_sigma_eta)
@@ -125,24 +125,30 @@ class SelectiveInferenceNorm(SelectiveInference):
             if isinstance(var, float):
                 sigma_eta = var * eta
             elif len(var.shape) == 1:
-                diag_cov = torch.tensor(var, dtype=data.dtype)
+                diag_cov = torch.as_tensor(var, dtype=data.dtype, device=data.device)
                 sigma_eta = diag_cov * eta
             else:
-                cov = torch.tensor(var, dtype=data.dtype)
+                cov = torch.as_tensor(var, dtype=data.dtype, device=data.device)
                 sigma_eta = torch.mv(cov, eta)
             eta_sigma_eta = torch.dot(eta, sigma_eta)
             sqrt_eta_sigma_eta = torch.sqrt(eta_sigma_eta)
             self.stat = torch.dot(eta, data) / sqrt_eta_sigma_eta
 
         else:
-            data, eta = np.array(data), np.array(eta)
+            # the inputs are only read, so avoid copying the given arrays
+            data, eta = np.asarray(data), np.asarray(eta)
             if isinstance(var, float):
                 sigma_eta = var * eta
             elif len(var.shape) == 1:
-                diag_cov = np.array(var)
+                diag_cov = np.asarray(var)
                 sigma_eta = diag_cov * eta
+            elif use_sparse and sparse.issparse(var):
+                # any sparse format supports the product, so avoid converting it
+                sigma_eta = var @ eta
             else:
-                cov = sparse.csr_array(var) if use_sparse else np.array(var)
+                # a dense covariance is applied only once, so it is not converted
+                # into the sparse format even when use_sparse is True
+                cov = np.asarray(var)
                 sigma_eta = cov @ eta
             eta_sigma_eta = eta @ sigma_eta
             sqrt_eta_sigma_eta = np.sqrt(eta_sigma_eta)
@@ -226,7 +232,7 @@ class SelectiveInferenceChi(SelectiveInference):
 
             degree = int(tf.linalg.trace(projection) + 1e-3)
             projected_data = tf.tensordot(projection, data, axes=1)
-            self.stat = tf.norm((var**-0.5) * projected_data, ord=2)
+            self.stat = tf.norm(projected_data, ord=2) / np.sqrt(var)
 
         elif use_torch:
             import torch
@@ -240,21 +246,26 @@ class SelectiveInferenceChi(SelectiveInference):
             # trace of P
             degree = int(torch.trace(projection) + 1e-3)
             projected_data = torch.mv(projection, data)
-            self.stat = torch.linalg.norm((var**-0.5) * projected_data, ord=2)
+            self.stat = torch.linalg.norm(projected_data, ord=2) / np.sqrt(var)
 
         else:
-            data = np.array(data)
-            projection = (
-                sparse.csr_array(projection) if use_sparse else np.array(projection)
-            )
+            data = np.asarray(data)
+            if use_sparse:
+                # any sparse format supports the trace and the product
+                if not sparse.issparse(projection):
+                    projection = sparse.csr_array(projection)
+            else:
+                projection = np.asarray(projection)
             degree = int(projection.trace() + 1e-3)
             projected_data = projection @ data
-            self.stat = np.linalg.norm((var**-0.5) * projected_data, ord=2).item()
+            # var is a scalar, so scale the norm instead of each element
+            self.stat = np.linalg.norm(projected_data, ord=2).item() / np.sqrt(var)
 
         self.stat = float(self.stat)
 
         self.b = projected_data / self.stat
-        self.a = data - self.stat * self.b
+        # stat * b equals the projected data, so subtract it without rescaling
+        self.a = data - projected_data
 
         self.mode = np.sqrt(degree - 1)
         self.support = RealSubset([[0.0, np.inf]])
@@ -1,15 +1,33 @@
 """Module containing the classes for plotting figures."""
 
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 
-import matplotlib.pyplot as plt
 import numpy as np
 from scipy.stats import ecdf, norm, uniform  # type: ignore[import]
 
 from sicore.core.base import SelectiveInferenceResult
 from sicore.utils.evaluation import rejection_rate
 
-plt.rcParams.update({"figure.autolayout": True})
+
+@cache
+def _pyplot() -> ModuleType:
+    """Import matplotlib.pyplot on first use and apply the default settings.
+
+    The global default `figure.autolayout` of matplotlib is enabled on the first
+    call of the plotting functions, rather than when this module is imported.
+
+    Returns
+    -------
+    ModuleType
+        The matplotlib.pyplot module.
+    """
+    # importing pyplot takes a large part of the import time of the package
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    plt.rcParams.update({"figure.autolayout": True})
+    return plt
 
 
 def pvalues_hist(
@@ -35,6 +53,7 @@ def pvalues_hist(
     figsize : tuple[float, float], optional
         Size of the figure. Defaults to (6, 4).
     """
+    plt = _pyplot()
     plt.figure(figsize=figsize)
     if title is not None:
         plt.title(title)
@@ -74,9 +93,11 @@ def pvalues_qqplot(
         Size of the figure. Defaults to (4, 4).
     """
     n = len(p_values)
-    plot_pos = plot_pos or [k / (n + 1) for k in range(1, n + 1)]
-    t_quantiles = list(map(uniform.ppf, plot_pos))  # theoretical
-    e_quantiles = list(map(ecdf(p_values).cdf.evaluate, plot_pos))  # empirical
+    if plot_pos is None:
+        plot_pos = [k / (n + 1) for k in range(1, n + 1)]
+    t_quantiles = uniform.ppf(plot_pos)  # theoretical
+    e_quantiles = ecdf(p_values).cdf.evaluate(plot_pos)  # empirical
+    plt = _pyplot()
     plt.figure(figsize=figsize)
     if title is not None:
         plt.title(title)
@@ -247,6 +268,7 @@ class SummaryFigure:
         fontsize : int, optional
             Font size of the legend. Defaults to 10.
         """
+        plt = _pyplot()
         plt.rcParams.update({"font.size": fontsize})
 
         plt.title(self.title if self.title is not None else "")
@@ -1,13 +1,15 @@
 """Module providing functions for computing intervals and solving inequalities."""
 
-from itertools import pairwise
-
 import numpy as np
 from numpy.polynomial import Polynomial
 from scipy import sparse  # type: ignore[import]
 
 from sicore.core.real_subset import complement, intersection, simplify, union
 
+# the largest distance between the roots of a quadratic polynomial merged into
+# a double root, which is the default tolerance of `simplify`
+_ROOT_MERGE_TOL = 1e-10
+
 
 def difference(intervals1: np.ndarray, intervals2: np.ndarray) -> np.ndarray:
     """Take the difference of first intervals with second intervals.
@@ -65,11 +67,11 @@ def polynomial_below_zero(
         Intervals where the polynomial is below zero.
     """
     if isinstance(poly_or_coef, Polynomial):
-        coef = poly_or_coef.coef.tolist()
+        coef = poly_or_coef.coef
     else:
-        coef = np.array(poly_or_coef).tolist()
+        coef = np.asarray(poly_or_coef, dtype=float)
 
-    coef = [0 if -tol < c_ < tol else c_ for c_ in coef]
+    coef = np.where((-tol < coef) & (coef < tol), 0.0, coef)
     poly = Polynomial(coef).trim()
 
     if poly.degree() == 0:
@@ -88,20 +90,17 @@ def polynomial_below_zero(
         roots = roots_.tolist()
 
     roots = np.unique(roots)
-    intervals = []
 
-    if poly(roots[0] - 1) <= 0:
-        intervals.append([-np.inf, roots[0]])
-    for start, end in pairwise(roots):
-        if end - start < tol:
-            continue
-        mid = (start + end) / 2
-        if poly(mid) <= 0:
-            intervals.append([start, end])
-    if poly(roots[-1] + 1) <= 0:
-        intervals.append([roots[-1], np.inf])
+    # evaluate the polynomial at a point inside each interval between the roots
+    probes = np.concatenate(
+        [[roots[0] - 1], (roots[:-1] + roots[1:]) / 2, [roots[-1] + 1]],
+    )
+    ends = np.concatenate([[-np.inf], roots, [np.inf]])
+    mask = (poly(probes) <= 0) & (np.diff(ends) >= tol)
+    intervals = np.column_stack([ends[:-1][mask], ends[1:][mask]])
 
-    return simplify(np.array(intervals)).tolist()
+    # the intervals are sorted by construction, so only merge the adjacent ones
+    return simplify(intervals, is_sorted=True).tolist()
 
 
 def polytope_below_zero(
@@ -119,6 +118,17 @@ def polytope_below_zero(
     The polytope is defined as the set of z such that
     (a_vec+b_vec*z)^T A (a_vec+b_vec*z) + b^T (a_vec+b_vec*z) + c < 0.0.
 
+    The quadratic polynomial in z is solved in closed form, so its roots are only
+    resolved up to the rounding errors of the coefficients, about the square root
+    of the machine epsilon relative to their scale. Within that scale, two close
+    roots may be found as a double root or as two distinct roots. A double root,
+    including complex roots whose imaginary parts are less than `tol`, gives no
+    interval for a positive quadratic term and the whole real line for a negative
+    one. Otherwise, for a positive quadratic term, the interval between the roots
+    is returned only if it is at least `tol` wide. For a negative quadratic term,
+    the two rays outside the roots are merged into the whole real line only if the
+    roots are within 1e-10, regardless of `tol`.
+
     Parameters
     ----------
     a_vector : np.ndarray
@@ -144,12 +154,16 @@ def polytope_below_zero(
     alpha, beta, gamma = 0.0, 0.0, 0.0
 
     if a is not None:
-        a_mat = np.array(a) if not use_sparse else sparse.csr_matrix(a)
-        a_a_mat = a_vector @ a_mat
-        b_a_mat = b_vector @ a_mat
-        alpha += b_a_mat @ b_vector
-        beta += a_a_mat @ b_vector + b_a_mat @ a_vector
-        gamma += a_a_mat @ a_vector
+        if sparse.issparse(a):
+            a_mat = a
+        else:
+            a_mat = sparse.csr_matrix(a) if use_sparse else np.asarray(a)
+        # two matrix-vector products suffice, and the rest are inner products
+        a_mat_a = a_mat @ a_vector
+        a_mat_b = a_mat @ b_vector
+        alpha += b_vector @ a_mat_b
+        beta += a_vector @ a_mat_b + b_vector @ a_mat_a
+        gamma += a_vector @ a_mat_a
 
     if b is not None:
         beta += b @ b_vector
@@ -158,7 +172,61 @@ def polytope_below_zero(
     if c is not None:
         gamma += c
 
-    return polynomial_below_zero([gamma, beta, alpha], tol=tol)
+    return _quadratic_below_zero(alpha, beta, gamma, tol=tol)
+
+
+def _quadratic_below_zero(
+    alpha: float,
+    beta: float,
+    gamma: float,
+    tol: float = 1e-10,
+) -> list[list[float]]:
+    """Compute intervals where a given quadratic polynomial is below zero.
+
+    The roots are given in closed form instead of the eigenvalues of the companion
+    matrix, and the tolerance is handled in the same way as `polynomial_below_zero`.
+
+    Parameters
+    ----------
+    alpha : float
+        Coefficient of the quadratic term.
+    beta : float
+        Coefficient of the linear term.
+    gamma : float
+        Constant term.
+    tol : float, optional
+        Tolerance error parameter. Defaults to 1e-10.
+
+    Returns
+    -------
+    list[list[float]]
+        Intervals where the quadratic polynomial is below zero.
+    """
+    if -tol < alpha < tol:
+        return polynomial_below_zero([gamma, beta], tol=tol)
+    beta = 0.0 if -tol < beta < tol else beta
+    gamma = 0.0 if -tol < gamma < tol else gamma
+
+    discriminant = beta**2 - 4.0 * alpha * gamma
+    if discriminant < 0.0 and np.sqrt(-discriminant) / (2.0 * abs(alpha)) >= tol:
+        # no real roots, so the sign is the same as the quadratic term everywhere
+        return [[-np.inf, np.inf]] if alpha < 0.0 else []
+
+    if discriminant <= 0.0:
+        # a double root, including the complex roots with negligible imaginary parts
+        lower = upper = float(-beta / (2.0 * alpha))
+    else:
+        # avoid the cancellation between beta and the square root of the discriminant
+        q = -0.5 * (beta + np.copysign(np.sqrt(discriminant), beta))
+        lower, upper = sorted([float(q / alpha), float(gamma / q)])
+
+    if alpha > 0.0:
+        return [[lower, upper]] if upper - lower >= tol else []
+    # the rays are merged only if they touch up to the rounding errors of the roots,
+    # regardless of tol, in the same way as `polynomial_below_zero` merges them
+    if upper - lower <= _ROOT_MERGE_TOL:
+        return [[-np.inf, np.inf]]
+    return [[-np.inf, lower], [upper, np.inf]]
 
 
 def linear_polynomials_below_zero(
@@ -5,10 +5,10 @@ from typing import Literal
 import numpy as np
 from scipy.integrate import quad  # type: ignore[import]
 from scipy.optimize import brentq  # type: ignore[import]
+from scipy.special import ndtr  # type: ignore[import]
 from scipy.stats import (  # type: ignore[import]
     exponnorm,
     gennorm,
-    norm,
     rv_continuous,
     skewnorm,
     t,
@@ -33,8 +33,8 @@ def _standardize(rv: rv_continuous, param: float) -> rv_continuous:
     rv_continuous
         Standardized random variable object with the given parameter.
     """
-    mean = rv.mean(param)
-    std = rv.std(param)
+    mean, var = rv.stats(param, moments="mv")
+    std = np.sqrt(var)
     return rv(param, loc=-mean / std, scale=1 / std)
 
 
@@ -63,18 +63,21 @@ def generate_non_gaussian_rv(
         which has the specified Wasserstein distance from the standard gaussian distribution.
     """
     rv = rv_dict[rv_name]
+
+    def _wasserstein_distance(param: float) -> float:
+        # standardize once per parameter, not at every quadrature node
+        standardized_rv = _standardize(rv, param)
+        return quad(
+            lambda z: np.abs(standardized_rv.cdf(z) - ndtr(z)),
+            -np.inf,
+            np.inf,
+        )[0]
+
     try:
         param = param_dict[rv_name][f"{distance:.2f}"]
     except (KeyError, ValueError):
         param = brentq(
-            lambda param: (
-                quad(
-                    lambda z: np.abs(_standardize(rv, param).cdf(z) - norm.cdf(z)),
-                    -np.inf,
-                    np.inf,
-                )[0]
-                - distance
-            ),
+            lambda param: _wasserstein_distance(param) - distance,
             *range_dict[rv_name],
         )
     return _standardize(rv, param)
@@ -8,7 +8,8 @@ if TYPE_CHECKING:
 
 import numpy as np
 from numpy.polynomial import Polynomial
-from scipy.stats import chi2, ecdf, kstwo, norm  # type: ignore[import]
+from scipy.special import chdtrc, ndtr  # type: ignore[import]
+from scipy.stats import ecdf, kstwo  # type: ignore[import]
 from scipy.stats._hypotests import _cdf_cvm  # type: ignore[import]
 
 
@@ -231,16 +232,19 @@ class KuiperTest(UniformityTest):
     def _sf(self, stats: np.ndarray) -> np.ndarray:
         n = self._sample_size
         stats = stats * np.sqrt(n)
+        # loop invariants of the series
+        squared_stats = stats * stats
+        denominator = 3.0 * np.sqrt(n)
 
         precision = 1e-10
         tot, cond = np.zeros_like(stats), np.ones_like(stats, dtype=bool)
         k = 1
         while np.any(cond):
-            term_ = k * k * stats[cond] ** 2.0
+            term_ = k * k * squared_stats[cond]
             exp_term_ = np.exp(-2.0 * term_)
             term1 = ((-1.0) ** (k - 1)) * (4.0 * term_ - 1.0) * exp_term_
             term2 = k * k * (4.0 * term_ - 3.0) * exp_term_
-            term = 2.0 * term1 - 8.0 * stats[cond] * term2 / (3.0 * np.sqrt(n))
+            term = 2.0 * term1 - 8.0 * stats[cond] * term2 / denominator
             tot[cond] += term
             cond[cond] = np.abs(term) >= precision
             k += 1
@@ -420,7 +424,7 @@ class PearsonTest(UniformityTest):
         return -2.0 * np.sum(np.log(samples), axis=1)
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return chi2.sf(stats, 2 * self._sample_size)
+        return chdtrc(2 * self._sample_size, stats)
 
 
 class SukhatmeTest(UniformityTest):
@@ -439,7 +443,16 @@ class SukhatmeTest(UniformityTest):
         return -2.0 * np.sum(np.log(values), axis=1)
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return chi2.sf(stats, 2 * self._sample_size)
+        return chdtrc(2 * self._sample_size, stats)
+
+
+# Orthonormal Legendre polynomials on [-0.5, 0.5] used by Neyman's smooth tests.
+_NEYMAN_POLYNOMIALS = (
+    Polynomial([0.0, 2.0 * np.sqrt(3.0)]),
+    Polynomial([-0.5 * np.sqrt(5.0), 0.0, 6.0 * np.sqrt(5.0)]),
+    Polynomial([0.0, -3.0 * np.sqrt(7.0), 0.0, 20.0 * np.sqrt(7.0)]),
+    Polynomial([1.125, 0.0, -45.0, 0.0, 210.0]),
+)
 
 
 class NeymanFirstOrderTest(UniformityTest):
@@ -453,14 +466,13 @@ class NeymanFirstOrderTest(UniformityTest):
 
     def _statistic(self, samples: np.ndarray) -> np.ndarray:
         n = samples.shape[1]
-        polynomials = [Polynomial([0.0, 2.0 * np.sqrt(3.0)])]
         values = np.zeros(samples.shape[0])
-        for poly in polynomials:
+        for poly in _NEYMAN_POLYNOMIALS[:1]:
             values += np.sum(poly(samples - 0.5), axis=1) ** 2.0
         return values / n
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return chi2.sf(stats, 1)
+        return chdtrc(1, stats)
 
 
 class NeymanSecondOrderTest(UniformityTest):
@@ -474,17 +486,13 @@ class NeymanSecondOrderTest(UniformityTest):
 
     def _statistic(self, samples: np.ndarray) -> np.ndarray:
         n = samples.shape[1]
-        polynomials = [
-            Polynomial([0.0, 2.0 * np.sqrt(3.0)]),
-            Polynomial([-0.5 * np.sqrt(5.0), 0.0, 6.0 * np.sqrt(5.0)]),
-        ]
         values = np.zeros(samples.shape[0])
-        for poly in polynomials:
+        for poly in _NEYMAN_POLYNOMIALS[:2]:
             values += np.sum(poly(samples - 0.5), axis=1) ** 2.0
         return values / n
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return chi2.sf(stats, 2)
+        return chdtrc(2, stats)
 
 
 class NeymanThirdOrderTest(UniformityTest):
@@ -498,18 +506,13 @@ class NeymanThirdOrderTest(UniformityTest):
 
     def _statistic(self, samples: np.ndarray) -> np.ndarray:
         n = samples.shape[1]
-        polynomials = [
-            Polynomial([0.0, 2.0 * np.sqrt(3.0)]),
-            Polynomial([-0.5 * np.sqrt(5.0), 0.0, 6.0 * np.sqrt(5.0)]),
-            Polynomial([0.0, -3.0 * np.sqrt(7.0), 0.0, 20.0 * np.sqrt(7.0)]),
-        ]
         values = np.zeros(samples.shape[0])
-        for poly in polynomials:
+        for poly in _NEYMAN_POLYNOMIALS[:3]:
             values += np.sum(poly(samples - 0.5), axis=1) ** 2.0
         return values / n
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return chi2.sf(stats, 3)
+        return chdtrc(3, stats)
 
 
 class NeymanFourthOrderTest(UniformityTest):
@@ -523,19 +526,13 @@ class NeymanFourthOrderTest(UniformityTest):
 
     def _statistic(self, samples: np.ndarray) -> np.ndarray:
         n = samples.shape[1]
-        polynomials = [
-            Polynomial([0.0, 2.0 * np.sqrt(3.0)]),
-            Polynomial([-0.5 * np.sqrt(5.0), 0.0, 6.0 * np.sqrt(5.0)]),
-            Polynomial([0.0, -3.0 * np.sqrt(7.0), 0.0, 20.0 * np.sqrt(7.0)]),
-            Polynomial([1.125, 0.0, -45.0, 0.0, 210.0]),
-        ]
         values = np.zeros(samples.shape[0])
-        for poly in polynomials:
+        for poly in _NEYMAN_POLYNOMIALS[:4]:
             values += np.sum(poly(samples - 0.5), axis=1) ** 2.0
         return values / n
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return chi2.sf(stats, 4)
+        return chdtrc(4, stats)
 
 
 class ShermanTest(UniformityTest):
@@ -557,7 +554,7 @@ class ShermanTest(UniformityTest):
         return v - 0.0955 * (v**2.0 - 1.0) / np.sqrt(n)
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return norm.sf(stats)
+        return ndtr(-stats)
 
 
 class KimballTest(UniformityTest):
@@ -672,7 +669,7 @@ class YangTest(UniformityTest):
         return (2.0 * (n + 1.0) * m - n) * np.sqrt(3.0 / (2.0 * n - 1.0))
 
     def _sf(self, stats: np.ndarray) -> np.ndarray:
-        return norm.sf(stats)
+        return ndtr(-stats)
 
 
 class FroziniTest(UniformityTest):
@@ -5,7 +5,8 @@ import pytest
 from numpy.testing import assert_allclose
 from scipy.stats import chi, norm, rv_continuous  # type: ignore[import]
 
-from sicore.core.cdf import truncated_cdf
+from sicore.core.cdf import truncated_cdf, truncated_cdf_range
+from sicore.core.real_subset import RealSubset
 
 
 @pytest.mark.parametrize(
@@ -50,3 +51,50 @@ def test_truncated_cdf(
     """Test the truncated cdf function."""
     value = truncated_cdf(rv, z, intervals, absolute=absolute)
     assert_allclose(value, expected, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("rv", "z", "truncated", "unsearched", "absolute"),
+    [
+        (norm(), 0.8, [[0.1, 2.3]], [[-np.inf, -1.0], [3.0, np.inf]], False),
+        (norm(), -1.7, [[-2.0, -1.5], [1.0, 1.2]], [[-1.5, 1.0]], True),
+        (norm(), 2.0, [[1.0, 3.0]], [[-3.0, 0.5], [3.0, 5.0]], True),
+        (chi(5), 2.3, [[2.0, 2.5]], [[0.0, 2.0], [2.5, np.inf]], False),
+        (norm(), 0.8, [[-2.0, -1.0]], [[0.5, 3.0]], False),
+        (norm(), -1.2, [[2.0, 3.0]], [[-1.5, 1.0]], True),
+    ],
+)
+def test_truncated_cdf_range(
+    rv: rv_continuous,
+    z: float,
+    truncated: list[list[float]],
+    unsearched: list[list[float]],
+    *,
+    absolute: bool,
+) -> None:
+    """Test the truncated cdf range function."""
+    truncated_intervals = RealSubset(truncated)
+    unsearched_intervals = RealSubset(unsearched)
+    mask = RealSubset([[-abs(z), abs(z)]] if absolute else [[-np.inf, z]])
+    expected = (
+        truncated_cdf(
+            rv,
+            z,
+            truncated_intervals | (unsearched_intervals - mask),
+            absolute=absolute,
+        ),
+        truncated_cdf(
+            rv,
+            z,
+            truncated_intervals | (unsearched_intervals & mask),
+            absolute=absolute,
+        ),
+    )
+    value = truncated_cdf_range(
+        rv,
+        z,
+        truncated_intervals,
+        unsearched_intervals,
+        absolute=absolute,
+    )
+    assert_allclose(value, expected, rtol=1e-10, atol=1e-12)
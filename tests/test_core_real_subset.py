@@ -41,6 +41,7 @@ def test_complement(intervals: list[list[float]], expected: list[list[float]]) -
         ([[1.0, 3.0], [5.0, 7.0]], [[1.0, 7.0]], [[1.0, 7.0]]),
         ([[2.0, 4.0]], [[0.0, 1.0], [5.0, 7.0]], [[0.0, 1.0], [2.0, 4.0], [5.0, 7.0]]),
         ([[-np.inf, 2.0]], [[1.0, 4.0], [5.0, 7.0]], [[-np.inf, 4.0], [5.0, 7.0]]),
+        ([[0.0, 1.0], [2.0, 3.0]], [[1.0 + 1e-12, 2.0 - 1e-12]], [[0.0, 3.0]]),
     ],
 )
 def test_union(
@@ -59,6 +60,12 @@ def test_union(
         ([[1.0, 3.0], [5.0, 7.0]], [[1.0, 7.0]], [[1.0, 3.0], [5.0, 7.0]]),
         ([[2.0, 4.0]], [[0.0, 1.0], [5.0, 7.0]], [[]]),
         ([[-np.inf, 2.0]], [[1.0, 4.0], [5.0, 7.0]], [[1.0, 2.0]]),
+        ([[0.0, 1.0], [2.0, 3.0]], [[1.0 - 1e-11, 2.5]], [[2.0, 2.5]]),
+        (
+            [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]],
+            [[-np.inf, np.inf]],
+            [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]],
+        ),
     ],
 )
 def test_intersection(
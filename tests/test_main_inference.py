@@ -315,3 +315,75 @@ def test_marginal_screening_chi(
             expected_p_value <= significance_level
         )
         assert_allclose(result.stat, expected_stat, rtol=1e-4, atol=1e-4)
+
+
+def test_exhaustive_search_narrow_gap() -> None:
+    """Test the exhaustive search over the intervals narrower than the step."""
+    step = 1e-6
+    edges = [0.1, 0.1 + 0.2 * step]
+
+    def algorithm(a: np.ndarray, b: np.ndarray, z: float) -> tuple[int, list]:
+        _ = a, b
+        model = int(np.searchsorted(edges, z))
+        bounds = [-np.inf, *edges, np.inf]
+        return model, [[bounds[model], bounds[model + 1]]]
+
+    si = SelectiveInferenceNorm(np.array([0.5]), 1.0, np.array([1.0]))
+    result = si.inference(
+        algorithm,
+        lambda model: model == len(edges),
+        inference_mode="exhaustive",
+        step=step,
+    )
+    assert result.search_count == len(edges) + 1
+    assert_allclose(result.truncated_intervals, [[edges[-1], np.inf]])
+    assert_allclose(result.p_value, 0.670483, rtol=1e-5)
+
+
+@pytest.mark.parametrize("termination_criterion", ["precision", "decision"])
+def test_search_starting_away_from_stat(
+    termination_criterion: Literal["precision", "decision"],
+) -> None:
+    """Test the inference whose first search point is not the test statistic."""
+    edges = [-1.0, 1.0]
+    search_points = iter([-2.0, 0.5, 2.0])
+
+    def algorithm(a: np.ndarray, b: np.ndarray, z: float) -> tuple[int, list]:
+        _ = a, b
+        model = int(np.searchsorted(edges, z))
+        bounds = [-np.inf, *edges, np.inf]
+        return model, [[bounds[model], bounds[model + 1]]]
+
+    si = SelectiveInferenceNorm(np.array([0.5]), 1.0, np.array([1.0]))
+    result = si.inference(
+        algorithm,
+        lambda model: model == 1,
+        search_strategy=lambda _: next(search_points),
+        termination_criterion=termination_criterion,
+    )
+    assert_allclose(result.truncated_intervals, [edges])
+    assert_allclose(result.p_value, 0.439094, rtol=1e-5)
+
+
+def test_parallel_inference_matches_serial() -> None:
+    """Test the parallel exhaustive search against the serial one."""
+    rng = np.random.default_rng(0)
+    n, p, k, sigma = 100, 10, 5, 1.0
+    X = rng.normal(size=(n, p))
+    y = rng.normal(size=n)
+    ms = MarginalScreeningNorm(X, y, sigma, k)
+    eta = ms.construct_eta(0)
+
+    results = [
+        SelectiveInferenceNorm(y, sigma, eta).inference(
+            ms.algorithm,
+            ms.model_selector,
+            inference_mode="exhaustive",
+            n_jobs=n_jobs,
+        )
+        for n_jobs in [1, 3]
+    ]
+    serial, parallel = results
+    assert_allclose(parallel.truncated_intervals, serial.truncated_intervals)
+    assert_allclose(parallel.searched_intervals, serial.searched_intervals)
+    assert_allclose(parallel.p_value, serial.p_value, rtol=1e-10)
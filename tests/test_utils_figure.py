@@ -0,0 +1,18 @@
+"""Module with tests for the figure utilities."""
+
+from pathlib import Path
+
+import matplotlib as mpl
+import numpy as np
+
+from sicore.utils.figure import pvalues_qqplot
+
+mpl.use("Agg")
+
+
+def test_pvalues_qqplot_plot_pos(tmp_path: Path) -> None:
+    """Test the pvalues qqplot function with the plotting positions in an array."""
+    rng = np.random.default_rng(0)
+    fname = tmp_path / "qqplot.png"
+    pvalues_qqplot(rng.uniform(size=20), plot_pos=np.linspace(0.1, 0.9, 9), fname=fname)
+    assert fname.exists()
@@ -167,6 +167,10 @@ def test_polynomial_below_zero(coef: list[float], expected: list[list[float]]) -
             2.0,
             [[-np.inf, 0.0], [2.0, np.inf]],
         ),
+        ([-1.0, -1.0], [1.0, 1.0], np.eye(2), None, None, []),
+        ([-1.0, -1.0], [1.0, 1.0], -np.eye(2), None, None, [[-np.inf, np.inf]]),
+        ([-1.0, -1.0], [1.0, 1.0], np.eye(2), None, 1.0, []),
+        ([-1.0, -1.0], [1.0, 1.0], -np.eye(2), None, -1.0, [[-np.inf, np.inf]]),
     ],
 )
 def test_polytope_below_zero(
@@ -182,6 +186,55 @@ def test_polytope_below_zero(
     assert_allclose(polytope_below_zero(a_vector_, b_vector_, a, b, c), expected)
 
 
+@pytest.mark.parametrize(
+    ("a", "c", "expected"),
+    [
+        (-np.eye(1), 1e-8, [[-np.inf, 1.0 - 1e-4], [1.0 + 1e-4, np.inf]]),
+        (np.eye(1), -1e-8, []),
+    ],
+)
+def test_polytope_below_zero_tol(
+    a: np.ndarray,
+    c: float,
+    expected: list[list[float]],
+) -> None:
+    """Test the polytope below zero function with the roots closer than tol."""
+    a_vector, b_vector = np.array([-1.0]), np.array([1.0])
+    assert_allclose(
+        polytope_below_zero(a_vector, b_vector, a, None, c, tol=1e-3),
+        expected,
+    )
+
+
+@pytest.mark.parametrize(
+    ("alpha", "roots", "expected"),
+    [
+        (3.0, [0.3, 0.3 + 1e-9], []),
+        (-3.0, [0.3, 0.3 + 1e-9], [[-np.inf, np.inf]]),
+        (3.0, [0.3, 0.3 + 1e-6], [[0.3, 0.3 + 1e-6]]),
+        (-3.0, [0.3, 0.3 + 1e-6], [[-np.inf, 0.3], [0.3 + 1e-6, np.inf]]),
+        (3.0, [-1.7, -1.7 + 1e-11], [[-1.7, -1.7]]),
+        (-3.0, [-1.7, -1.7 + 1e-11], [[-np.inf, -1.7], [-1.7, np.inf]]),
+    ],
+)
+def test_polytope_below_zero_close_roots(
+    alpha: float,
+    roots: list[float],
+    expected: list[list[float]],
+) -> None:
+    """Test the polytope below zero function with the close roots.
+
+    The close roots are resolved only up to the rounding errors of the coefficients,
+    so the roots of the last two cases are found about 4e-8 apart.
+    """
+    b = np.array([-alpha * sum(roots)])
+    c = alpha * roots[0] * roots[1]
+    assert_allclose(
+        polytope_below_zero(np.array([0.0]), np.array([1.0]), alpha * np.eye(1), b, c),
+        expected,
+    )
+
+
 @pytest.mark.parametrize(
     ("a", "b", "expected"),
     [